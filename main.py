@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
-from src.config import Config
+from src.config import get_config
 from src.logger import setup_logger
 from src.content_generator import ContentGenerator
 from src.git_operations import GitManager
@@ -13,7 +14,7 @@ from src.git_operations import GitManager
 def main() -> None:
     """Run the daily contribution workflow end-to-end."""
     logger = setup_logger()
-    config = Config()
+    config = get_config()
     logger.info("Starting daily contributor workflow.")
 
     try:
@@ -21,12 +22,22 @@ def main() -> None:
         git_manager = GitManager(config, logger)
         generator = ContentGenerator(config, logger)
 
-        # Sync fork with upstream (best-effort)
-        git_manager.sync_with_upstream()
-
-        # Generate daily content and commit/push
-        branch_name, file_path = generator.generate_daily_content()
-        git_manager.commit_and_push(branch_name, file_path)
+        # The upstream sync (network-bound) and content generation
+        # (disk-bound) have no data dependency, so overlap them; only
+        # commit_and_push needs both to have finished.
+        if config.parallel_io:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                sync_future = pool.submit(git_manager.sync_with_upstream)
+                content_future = pool.submit(generator.generate_daily_content)
+                sync_future.result()
+                branch_name, file_path = content_future.result()
+        else:
+            # Sync fork with upstream (best-effort)
+            git_manager.sync_with_upstream()
+            branch_name, file_path = generator.generate_daily_content()
+
+        # Commit generated content and push
+        git_manager.commit_and_push(branch_name, [file_path])
         logger.info("Content branch created and pushed: %s", branch_name)
 
         # Optionally push logs to dedicated branch
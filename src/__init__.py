@@ -2,18 +2,30 @@
 
 This file defines the public interface of the package by explicitly
 exposing the main classes and functions intended for external use.
+
+`GitManager` is resolved lazily (PEP 562) so that `import src` does not
+pay GitPython's import cost for callers that never touch Git.
 """
 
 from __future__ import annotations
 
-from .config import Config
+from .config import Config, get_config
 from .content_generator import ContentGenerator
-from .git_operations import GitManager
 from .logger import setup_logger
 
 __all__ = [
     "Config",
+    "get_config",
     "ContentGenerator",
     "GitManager",
     "setup_logger",
 ]
+
+
+def __getattr__(name: str):
+    """Lazily resolve heavyweight exports on first attribute access."""
+    if name == "GitManager":
+        from .git_operations import GitManager
+
+        return GitManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
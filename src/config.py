@@ -2,41 +2,52 @@
 
 from __future__ import annotations
 
+import functools
 import os
+from dataclasses import dataclass
 from typing import Optional
 
 
+@dataclass(frozen=True, slots=True)
 class Config:
     """Centralized configuration holder for the application.
 
-    Loads and exposes environment variables used across the project.
-    All values are fetched once at initialization time.
+    Immutable snapshot of the environment variables used across the
+    project. Build instances through :func:`get_config` so the environment
+    is parsed once per process.
     """
 
-    def __init__(self) -> None:
-        self.repo_owner_alt: Optional[str] = os.getenv("REPO_OWNER_ALT")
-        self.repo_name_alt: Optional[str] = os.getenv("REPO_NAME_ALT")
-        self.repo_url_alt: Optional[str] = self._build_repo_url()
+    repo_owner_alt: Optional[str] = None
+    repo_name_alt: Optional[str] = None
+    repo_url_alt: Optional[str] = None
 
-        self.fork_path: Optional[str] = os.getenv("FORK_PATH")
-        self.remote_upstream: Optional[str] = os.getenv("REMOTE_UPSTREAM")
-        self.news_dir: Optional[str] = os.getenv("NEWS_DIR")
+    fork_path: Optional[str] = None
+    remote_upstream: Optional[str] = None
+    news_dir: Optional[str] = None
 
-        self.enable_log_branch: bool = self._get_bool_env("ENABLE_LOG_BRANCH")
-        self.log_branch: Optional[str] = os.getenv("LOG_BRANCH")
-        self.approved_user: Optional[str] = os.getenv("APPROVED_USER")
+    enable_log_branch: bool = False
+    log_branch: Optional[str] = None
+    approved_user: Optional[str] = None
+    parallel_io: bool = True
 
-    def _build_repo_url(self) -> Optional[str]:
-        """Constructs the GitHub repository URL if owner and name are available."""
-        if self.repo_owner_alt and self.repo_name_alt:
-            return f"https://github.com/{self.repo_owner_alt}/{self.repo_name_alt}.git"
-        return None
-
-    @staticmethod
-    def _get_bool_env(var_name: str, default: bool = False) -> bool:
-        """Converts an environment variable to a boolean value."""
-        value = os.getenv(var_name)
-        return str(value).strip().lower() == "true" if value is not None else default
+    @classmethod
+    def from_env(cls) -> "Config":
+        """Builds a Config from the current process environment."""
+        env = os.environ
+        repo_owner_alt = env.get("REPO_OWNER_ALT")
+        repo_name_alt = env.get("REPO_NAME_ALT")
+        return cls(
+            repo_owner_alt=repo_owner_alt,
+            repo_name_alt=repo_name_alt,
+            repo_url_alt=_build_repo_url(repo_owner_alt, repo_name_alt),
+            fork_path=env.get("FORK_PATH"),
+            remote_upstream=env.get("REMOTE_UPSTREAM"),
+            news_dir=env.get("NEWS_DIR"),
+            enable_log_branch=_get_bool_env("ENABLE_LOG_BRANCH"),
+            log_branch=env.get("LOG_BRANCH"),
+            approved_user=env.get("APPROVED_USER"),
+            parallel_io=_get_bool_env("PARALLEL_IO", default=True),
+        )
 
     def __repr__(self) -> str:
         """String representation for debugging purposes."""
@@ -46,3 +57,22 @@ class Config:
             f"repo_name_alt={self.repo_name_alt!r}, "
             f"enable_log_branch={self.enable_log_branch!r})"
         )
+
+
+def _build_repo_url(owner: Optional[str], name: Optional[str]) -> Optional[str]:
+    """Constructs the GitHub repository URL if owner and name are available."""
+    if owner and name:
+        return f"https://github.com/{owner}/{name}.git"
+    return None
+
+
+def _get_bool_env(var_name: str, default: bool = False) -> bool:
+    """Converts an environment variable to a boolean value."""
+    value = os.environ.get(var_name)
+    return str(value).strip().lower() == "true" if value is not None else default
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the process-wide Config, parsing the environment only once."""
+    return Config.from_env()
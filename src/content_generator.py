@@ -2,18 +2,70 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import random
 from datetime import date
-from typing import Optional, Tuple
+from pathlib import Path
+from typing import Final, Optional, Tuple
 
 from .utils import (
     branch_name_for_date,
     digest_filename_for_date,
-    write_text_file,
+    write_text_files_batch,
     ensure_dir,
 )
 
+# Headline pool and static digest sections, hoisted to module level so they
+# are allocated and interned once instead of rebuilt per call.
+_HEADLINES: Final[tuple[str, ...]] = (
+    "Quantum progress: stable qubits announced.",
+    "Python 4.0: rumors about stricter typing.",
+    "GitHub Copilot improves unit test generation.",
+    "Generative AI is reshaping UI/UX design.",
+)
+
+_SEP: Final[str] = os.sep
+
+# Name tables for the digest header date; indexing these beats strftime,
+# which acquires the C locale on every call.
+_DAY_NAMES: Final[tuple[str, ...]] = (
+    "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"
+)
+_MONTH_NAMES: Final[tuple[str, ...]] = (
+    "", "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+)
+
+# Private generator instance: avoids contending on the lock of the shared
+# module-level Mersenne Twister with any other random.* caller.
+_RNG: Final[random.Random] = random.Random()
+
+_EPILOGUE: Final[str] = (
+    "This digest explores how automation is reshaping developer "
+    "workflows: from CI to automated PR approvals. This repository "
+    "demonstrates an automated content pipeline.\n\n"
+    "---\n\n"
+    "Generated automatically by the daily contributor bot."
+)
+
+# Pre-encoded static tail so writes skip re-encoding it per call.
+_EPILOGUE_BYTES: Final[bytes] = _EPILOGUE.encode("utf-8")
+
+
+@functools.lru_cache(maxsize=8)
+def _digest_bytes(ordinal: int) -> bytes:
+    """Build the UTF-8 digest body for a date ordinal, memoized per process.
+
+    Backfill runs that revisit the same date reuse the cached body (and
+    therefore the same headline) instead of re-rendering and re-encoding.
+    """
+    d = date.fromordinal(ordinal)
+    date_str = f"{_DAY_NAMES[d.weekday()]}, {_MONTH_NAMES[d.month]} {d.day:02d}, {d.year}"
+    chosen_headline = _RNG.choice(_HEADLINES)
+    header = f"# Daily Tech Digest - {date_str}\n\n## {chosen_headline}\n\n"
+    return header.encode("utf-8") + _EPILOGUE_BYTES
+
 
 class ContentGenerator:
     """Generates and persists daily Markdown digest files."""
@@ -21,34 +73,22 @@ class ContentGenerator:
     def __init__(self, config, logger) -> None:
         self.config = config
         self.logger = logger
+        # Hot-path locations derived from config once per instance instead
+        # of re-joined on every generate call.
+        self._news_dir = os.fspath(Path(config.fork_path) / config.news_dir)
+        self._branch_file = os.fspath(Path(config.fork_path) / "branch_name.txt")
 
-    def _build_content(self, d: date) -> str:
+    def _build_content(self, d: date) -> bytes:
         """Builds the Markdown content for a given date.
 
         Args:
             d: The date for which to generate the digest.
 
         Returns:
-            A string containing the Markdown-formatted digest.
+            The UTF-8 encoded Markdown digest. Repeated calls for the same
+            date within a process return the same cached body.
         """
-        date_str = d.strftime("%A, %B %d, %Y")
-        headlines = [
-            "Quantum progress: stable qubits announced.",
-            "Python 4.0: rumors about stricter typing.",
-            "GitHub Copilot improves unit test generation.",
-            "Generative AI is reshaping UI/UX design.",
-        ]
-        chosen_headline = random.choice(headlines)
-
-        return (
-            f"# Daily Tech Digest - {date_str}\n\n"
-            f"## {chosen_headline}\n\n"
-            "This digest explores how automation is reshaping developer "
-            "workflows: from CI to automated PR approvals. This repository "
-            "demonstrates an automated content pipeline.\n\n"
-            "---\n\n"
-            "Generated automatically by the daily contributor bot."
-        )
+        return _digest_bytes(d.toordinal())
 
     def generate_daily_content(self, d: Optional[date] = None) -> Tuple[str, str]:
         """Generates the digest file and returns the branch name and file path.
@@ -63,26 +103,23 @@ class ContentGenerator:
         branch_name = branch_name_for_date(d)
         filename = digest_filename_for_date(d)
 
-        news_dir = os.path.join(self.config.fork_path, self.config.news_dir)
+        news_dir = self._news_dir
         ensure_dir(news_dir)
-        file_path = os.path.join(news_dir, filename)
+        file_path = f"{news_dir}{_SEP}{filename}"
 
         content = self._build_content(d)
+        branch_file_path = self._branch_file
 
-        # Write digest file
+        # Write the digest and the workflow's branch_name.txt in one batch
+        # so the directory fsync is paid once for both files.
         try:
-            write_text_file(file_path, content)
+            write_text_files_batch(
+                [(file_path, content), (branch_file_path, branch_name)]
+            )
             self.logger.info("Generated content at %s", file_path)
-        except Exception as exc:
-            self.logger.exception("Failed to write digest file: %s", exc)
-            raise
-
-        # Persist branch name for workflow use
-        branch_file_path = os.path.join(self.config.fork_path, "branch_name.txt")
-        try:
-            write_text_file(branch_file_path, branch_name)
             self.logger.debug("Wrote branch_name.txt with %s", branch_name)
         except Exception as exc:
-            self.logger.exception("Could not persist branch_name.txt: %s", exc)
+            self.logger.exception("Failed to write digest files: %s", exc)
+            raise
 
         return branch_name, file_path
@@ -3,10 +3,84 @@
 from __future__ import annotations
 
 import os
+import shlex
+import subprocess
+import time
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from git import Repo, GitCommandError, InvalidGitRepositoryError
+if TYPE_CHECKING:
+    from git import Repo
+
+# How long (seconds) a recorded "upstream unchanged" answer stays valid
+# before we re-verify with ls-remote.
+_SYNC_CACHE_TTL = 3600
+
+# Memoized GitPython module; see _lazy_import_git.
+_GIT = None
+
+
+def _lazy_import_git():
+    """Import and memoize GitPython on first use.
+
+    Importing `git` pulls in gitdb/smmap and shells out to `git --version`,
+    costing hundreds of milliseconds; deferring it keeps `import src` cheap
+    for callers that never touch Git.
+    """
+    global _GIT
+    if _GIT is None:
+        import git
+
+        _GIT = git
+    return _GIT
+
+
+class _GitSession:
+    """Long-lived ``git cat-file --batch-check`` pipe for cheap ref lookups.
+
+    GitPython forks a fresh ``git`` subprocess for many read-only queries;
+    holding one plumbing process open for the lifetime of the manager
+    amortizes the spawn cost across every lookup in the run.
+    """
+
+    def __init__(self, git_dir: str) -> None:
+        self._proc = subprocess.Popen(
+            ["git", f"--git-dir={git_dir}", "cat-file", "--batch-check"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def ref_exists(self, refname: str) -> Optional[bool]:
+        """Check whether `refname` resolves to an object in the repository.
+
+        Returns True/False on a successful lookup, or None if the pipe is
+        no longer usable (callers should fall back to GitPython).
+        """
+        if self._proc.poll() is not None:
+            return None
+        try:
+            self._proc.stdin.write(refname.encode("utf-8") + b"\n")
+            self._proc.stdin.flush()
+            line = self._proc.stdout.readline()
+        except (BrokenPipeError, OSError):
+            return None
+        if not line:
+            return None
+        # Found refs answer "<sha> <type> <size>", otherwise "<name> missing".
+        return not line.rstrip().endswith(b"missing")
+
+    def close(self) -> None:
+        """Terminate the background process and release its pipes."""
+        if self._proc.poll() is None:
+            try:
+                self._proc.stdin.close()
+                self._proc.terminate()
+            except OSError:
+                pass
+
+    def __del__(self) -> None:
+        self.close()
 
 
 class GitManager:
@@ -19,28 +93,146 @@ class GitManager:
         self.config = config
         self.logger = logger
 
+        git = _lazy_import_git()
         if repo:
             self.repo = repo
         else:
             try:
-                self.repo = Repo(self.config.fork_path)
-            except InvalidGitRepositoryError as exc:
+                # GitCmdObjectDB serves object lookups from one long-lived
+                # `git cat-file --batch` process instead of GitPython's
+                # pure-Python pack parser; parent-directory search is
+                # pointless here since fork_path is the repo root.
+                self.repo = git.Repo(
+                    self.config.fork_path,
+                    search_parent_directories=False,
+                    odbt=git.GitCmdObjectDB,
+                )
+            except git.InvalidGitRepositoryError as exc:
                 logger.exception("Invalid Git repository at %s", self.config.fork_path)
                 raise
 
+        # Read-only commands (fetch, status-style queries) need not take
+        # index.lock; the C locale skips localized output formatting in
+        # every spawned git process.
+        self.repo.git.update_environment(
+            GIT_OPTIONAL_LOCKS="0", LC_ALL="C", LANG="C"
+        )
+
+        self._session = _GitSession(self.repo.git_dir)
+        self._worktree = self.repo.working_tree_dir
+        self._relpath_cache: dict[str, str] = {}
+
     def _get_remote(self, name: str) -> Optional[Repo.remote]:
         """Return the remote object with the given name, or None if not found."""
+        # Remote names live in .git/config, which GitPython reads in-process;
+        # no ref lookup (and hence no _GitSession query) applies here.
         return next((r for r in self.repo.remotes if r.name == name), None)
 
+    def _has_ref(self, refname: str) -> bool:
+        """Check a fully qualified ref via the persistent plumbing session.
+
+        Falls back to GitPython's ref enumeration if the session pipe died.
+        """
+        found = self._session.ref_exists(refname)
+        if found is None:
+            return any(r.path == refname for r in self.repo.refs)
+        return found
+
+    def _relpath(self, path: str) -> str:
+        """Relpath against the worktree root, cached per distinct input."""
+        rel = self._relpath_cache.get(path)
+        if rel is None:
+            rel = os.path.relpath(path, self._worktree)
+            self._relpath_cache[path] = rel
+        return rel
+
+    def _push(self, branch_name: str) -> None:
+        """Push `branch_name` to origin, raising if the update was rejected.
+
+        GitPython's Remote.push reports per-ref failures through flags on
+        the returned PushInfo objects instead of raising, so a rejected
+        (e.g. non-fast-forward) push must be checked explicitly.
+        """
+        git = _lazy_import_git()
+        for info in self.repo.remote("origin").push(branch_name):
+            if info.flags & info.ERROR:
+                raise git.GitCommandError(
+                    ["git", "push", "origin", branch_name],
+                    1,
+                    stderr=info.summary.strip(),
+                )
+
     def _checkout_or_create_branch(self, name: str) -> None:
         """Checkout an existing branch or create it based on HEAD if missing."""
-        if name in self.repo.heads:
+        if self._has_ref(f"refs/heads/{name}"):
             self.repo.heads[name].checkout()
             self.logger.debug("Checked out existing branch %s", name)
         else:
             self.repo.create_head(name).checkout()
             self.logger.debug("Created and checked out new branch %s", name)
 
+    def _upstream_unchanged(self, main_branch: str) -> bool:
+        """Return True when upstream's main already matches our tracking ref.
+
+        Consults a timestamped sha cache in `.git/daily_contributor_last_sync`
+        first, so a second invocation within the TTL skips even the
+        `ls-remote` round-trip; otherwise asks the remote for its tip and
+        compares against the local remote-tracking ref.
+        """
+        remote = self.config.remote_upstream
+        try:
+            local_sha = self.repo.rev_parse(f"{remote}/{main_branch}").hexsha
+        except Exception:
+            return False
+
+        cache_path = os.path.join(self.repo.git_dir, "daily_contributor_last_sync")
+        now = time.time()
+        try:
+            with open(cache_path, "r", encoding="utf-8") as fh:
+                cached_sha, cached_ts = fh.read().split()
+            if cached_sha == local_sha and now - float(cached_ts) < _SYNC_CACHE_TTL:
+                return True
+        except (OSError, ValueError):
+            pass
+
+        try:
+            output = self.repo.git.ls_remote(remote, f"refs/heads/{main_branch}")
+        except _lazy_import_git().GitCommandError:
+            return False
+        remote_sha = output.split()[0] if output else None
+
+        if remote_sha != local_sha:
+            return False
+
+        try:
+            with open(cache_path, "w", encoding="utf-8") as fh:
+                fh.write(f"{local_sha} {now:.0f}")
+        except OSError:
+            pass
+        return True
+
+    def _checkout_main(self, main_branch: str) -> None:
+        """Check out local main, creating it from upstream or HEAD if missing.
+
+        commit_and_push parents new commits on HEAD, so every sync path must
+        leave HEAD on main even when no fetch or merge is needed.
+        """
+        if self._has_ref(f"refs/heads/{main_branch}"):
+            self.repo.git.checkout(main_branch)
+        elif self._has_ref(
+            f"refs/remotes/{self.config.remote_upstream}/{main_branch}"
+        ):
+            self.repo.git.checkout(
+                "-b",
+                main_branch,
+                f"{self.config.remote_upstream}/{main_branch}",
+            )
+        else:
+            self.repo.create_head(main_branch).checkout()
+            self.logger.warning(
+                "Created 'main' from current HEAD; upstream 'main' not found."
+            )
+
     def sync_with_upstream(self) -> None:
         """Fetch and merge `upstream/main` into local main (best-effort)."""
         try:
@@ -55,75 +247,143 @@ class GitManager:
                     self.config.repo_url_alt,
                 )
 
+            main_branch = "main"
+
+            if self._upstream_unchanged(main_branch):
+                # Only the network fetch is skippable; the local checkout
+                # must still restore HEAD to main (a previous log push may
+                # have left it on the log branch).
+                self._checkout_main(main_branch)
+                self.logger.info("Upstream already up to date; skipping fetch.")
+                return
+
             # Fetch upstream
             upstream.fetch()
 
-            main_branch = "main"
+            self._checkout_main(main_branch)
 
-            if main_branch in self.repo.heads:
-                self.repo.git.checkout(main_branch)
-            elif f"{self.config.remote_upstream}/{main_branch}" in self.repo.refs:
-                self.repo.git.checkout(
-                    "-b",
-                    main_branch,
+            # We just fetched, so merge the up-to-date remote-tracking ref
+            # directly; pull would rerun the fetch (a second network round
+            # trip). --ff-only also rules out accidental merge commits.
+            # Raw-bytes output: the result is discarded, so skip GitPython's
+            # UTF-8 decode of the subprocess stdout.
+            self.repo.git.execute(
+                [
+                    "git",
+                    "merge",
+                    "--ff-only",
                     f"{self.config.remote_upstream}/{main_branch}",
-                )
-            else:
-                self.repo.create_head(main_branch).checkout()
-                self.logger.warning(
-                    "Created 'main' from current HEAD; upstream 'main' not found."
-                )
-
-            self.repo.git.pull(self.config.remote_upstream, main_branch)
+                ],
+                stdout_as_string=False,
+                with_extended_output=False,
+            )
             self.logger.info("Synchronized fork with upstream/%s.", main_branch)
 
-        except GitCommandError as exc:
+        except _lazy_import_git().GitCommandError as exc:
             self.logger.warning("Could not fully sync with upstream: %s", exc)
 
     def commit_and_push(
-        self, branch_name: str, file_path: str, commit_message: Optional[str] = None
+        self,
+        branch_name: str,
+        file_paths: list[str],
+        commit_message: Optional[str] = None,
     ) -> None:
-        """Create branch, add file, commit, and push to origin.
+        """Create branch, add files, commit, and push to origin.
 
         Args:
             branch_name: Branch to create and push.
-            file_path: Absolute path to the file to add.
+            file_paths: Absolute paths of the files to add. Callers should
+                aggregate all files into a single call rather than looping;
+                one batched add acquires the index lock once instead of
+                once per file.
             commit_message: Optional commit message; auto-generated if None.
         """
-        commit_message = commit_message or f"feat: add {os.path.basename(file_path)}"
+        git = _lazy_import_git()
+        basenames = ", ".join(os.path.basename(p) for p in file_paths)
+        commit_message = commit_message or f"feat: add {basenames}"
+        relpaths = [self._relpath(p) for p in file_paths]
+        quoted_paths = " ".join(shlex.quote(r) for r in relpaths)
+
+        # Fast path: build the commit with plumbing against a scratch index
+        # instead of checkout/add/commit. The main index and working tree are
+        # never touched, so nothing rescans the worktree or takes index.lock.
+        # The push deliberately stays out of this invocation: once update-ref
+        # has moved the branch, re-running the discrete steps would commit
+        # the same content twice, so the fallback below must only cover
+        # failures that happen before the branch ref moves.
+        quoted_branch = shlex.quote(branch_name)
+        batched = (
+            'idx=$(mktemp)'
+            ' && GIT_INDEX_FILE=$idx git read-tree HEAD'
+            f' && GIT_INDEX_FILE=$idx git update-index --add -- {quoted_paths}'
+            ' && tree=$(GIT_INDEX_FILE=$idx git write-tree)'
+            f' && commit=$(git commit-tree "$tree" -p HEAD -m {shlex.quote(commit_message)})'
+            f' && git update-ref refs/heads/{quoted_branch} "$commit";'
+            ' status=$?; rm -f "$idx"; exit $status'
+        )
 
         try:
-            self._checkout_or_create_branch(branch_name)
-            relpath = os.path.relpath(file_path, self.repo.working_tree_dir)
-            self.repo.index.add([relpath])
-            self.repo.index.commit(commit_message)
-            origin = self.repo.remote("origin")
-            origin.push(branch_name)
-            self.logger.info("Pushed branch %s to origin", branch_name)
+            self.repo.git.execute(["bash", "-c", batched])
 
-        except GitCommandError as exc:
-            self.logger.exception("Git operation failed: %s", exc)
+        except git.GitCommandError:
+            # Fall back to the discrete GitPython steps so the failing
+            # operation is identifiable in the logs.
+            self.logger.warning(
+                "Batched commit failed; retrying discrete steps."
+            )
+            try:
+                self._checkout_or_create_branch(branch_name)
+                self.repo.index.add(relpaths)
+                self.repo.index.commit(commit_message)
+            except git.GitCommandError as exc:
+                self.logger.exception("Git operation failed: %s", exc)
+                raise
+
+        try:
+            self._push(branch_name)
+            self.logger.info("Pushed branch %s to origin", branch_name)
+        except git.GitCommandError as exc:
+            self.logger.exception("Git push failed: %s", exc)
             raise
 
     def push_logs_to_branch(self) -> None:
         """Commit logs/ directory and push to a dedicated log branch (best-effort)."""
         try:
             branch_name = self.config.log_branch
-            self._checkout_or_create_branch(branch_name)
 
             logs_dir = os.path.join(os.getcwd(), "logs")
             if not os.path.exists(logs_dir):
                 self.logger.info("No logs to push.")
                 return
 
-            rel_logs_dir = os.path.relpath(logs_dir, self.repo.working_tree_dir)
-            self.repo.index.add([rel_logs_dir])
-            self.repo.index.commit(
-                f"chore: update logs {datetime.utcnow().isoformat()}"
+            rel_logs_dir = self._relpath(logs_dir)
+            commit_message = f"chore: update logs {datetime.utcnow().isoformat()}"
+
+            # Same single-invocation batching as commit_and_push. The
+            # switch-or-create checkout appends to an existing log branch;
+            # `checkout -B` would reset it to HEAD and drop its history.
+            quoted_branch = shlex.quote(branch_name)
+            batched = (
+                f"(git checkout -q {quoted_branch} 2>/dev/null"
+                f" || git checkout -q -b {quoted_branch})"
+                f" && git add -- {shlex.quote(rel_logs_dir)}"
+                f" && git commit -m {shlex.quote(commit_message)}"
             )
 
-            origin = self.repo.remote("origin")
-            origin.push(branch_name)
+            try:
+                self.repo.git.execute(["bash", "-c", batched])
+            except _lazy_import_git().GitCommandError:
+                self.logger.warning(
+                    "Batched log commit failed; retrying discrete steps."
+                )
+                self._checkout_or_create_branch(branch_name)
+                self.repo.index.add([rel_logs_dir])
+                self.repo.index.commit(commit_message)
+
+            # Push outside the batched invocation and verify the result; a
+            # rejected push must reach the warning path below rather than
+            # being reported as success.
+            self._push(branch_name)
             self.logger.info("Logs pushed to branch %s", branch_name)
 
         except Exception as exc:
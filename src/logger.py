@@ -2,16 +2,57 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from datetime import datetime
 
+# Block-buffer size for the log file stream.
+_LOG_BUFFER_BYTES = 64 * 1024
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler with a block-buffered stream and lazy flushing.
+
+    The file is opened on the first record (delay=True) with a 64 KB
+    buffer, and only flushed eagerly for WARNING and above; INFO/DEBUG
+    records ride the buffer until rollover, close, or interpreter exit.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        kwargs.setdefault("delay", True)
+        self._defer_flush = False
+        super().__init__(*args, **kwargs)
+        atexit.register(self.flush)
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=_LOG_BUFFER_BYTES,
+            encoding=self.encoding,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self._defer_flush = record.levelno < logging.WARNING
+        try:
+            super().emit(record)
+        finally:
+            self._defer_flush = False
+
+    def flush(self) -> None:
+        if not self._defer_flush:
+            super().flush()
+
 
 def setup_logger(name: str = "daily_contributor") -> logging.Logger:
     """Create and return a configured logger.
 
     Logs are written to `logs/run_YYYYMMDD_HHMMSS.log` and also output to console.
+    Records are routed through an in-memory queue drained by a background
+    thread, so logging calls never block on file or console I/O.
 
     Args:
         name: Name of the logger.
@@ -25,6 +66,11 @@ def setup_logger(name: str = "daily_contributor") -> logging.Logger:
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = log_dir / f"run_{timestamp}.log"
 
+    # Skip per-record thread/process id collection; no format below uses them.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     logger = logging.getLogger(name)
 
     # Prevent duplicate handlers if logger already exists
@@ -33,20 +79,31 @@ def setup_logger(name: str = "daily_contributor") -> logging.Logger:
 
     logger.setLevel(logging.INFO)
     formatter = logging.Formatter(
-        "%(asctime)s [%(levelname)s] %(name)s - %(message)s"
+        "{asctime} [{levelname}] {name} - {message}", style="{"
     )
+    # Drop the ',mmm' millisecond suffix and its extra strftime pass.
+    formatter.default_msec_format = None
 
     # Rotating file handler (max 5MB, keep 3 backups)
-    file_handler = RotatingFileHandler(
+    file_handler = BufferedRotatingFileHandler(
         log_file, maxBytes=5 * 1024 * 1024, backupCount=3, encoding="utf-8"
     )
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
 
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+
+    # The logger only enqueues records; formatting and the actual writes
+    # happen on the listener's background thread.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
 
     logger.info("Logger initialized: %s", log_file)
     return logger
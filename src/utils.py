@@ -2,18 +2,46 @@
 
 from __future__ import annotations
 
+import functools
+import os
 from datetime import date
 from pathlib import Path
 from typing import Optional
 
+# Directories already created by this process; lets hot write paths skip
+# the redundant mkdir/stat syscall on repeat writes to the same directory.
+_ENSURED_DIRS: set[str] = set()
+
 
 def ensure_dir(path: str | Path) -> None:
     """Ensure that a directory exists, creating it if necessary.
 
+    Directories this process has already created are remembered, so repeat
+    calls return without issuing the mkdir syscall.
+
     Args:
         path: Directory path to ensure existence for.
     """
-    Path(path).mkdir(parents=True, exist_ok=True)
+    p = os.fspath(path)
+    if p in _ENSURED_DIRS:
+        return
+    Path(p).mkdir(parents=True, exist_ok=True)
+    _ENSURED_DIRS.add(p)
+
+
+def _write_atomic(target: str, encoded: bytes) -> None:
+    """Write pre-encoded bytes to `target` via a tmp file and rename."""
+    parent = os.path.dirname(target)
+    if parent:
+        ensure_dir(parent)
+
+    tmp_path = target + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, encoded)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, target)
 
 
 def write_text_file(path: str | Path, content: str, encoding: str = "utf-8") -> None:
@@ -27,17 +55,79 @@ def write_text_file(path: str | Path, content: str, encoding: str = "utf-8") ->
         content: Text content to write.
         encoding: File encoding (default 'utf-8').
     """
-    path = Path(path)
-    ensure_dir(path.parent)
-    tmp_path = path.with_suffix(path.suffix + ".tmp")
-    with tmp_path.open("w", encoding=encoding) as f:
-        f.write(content)
-    tmp_path.replace(path)
+    _write_atomic(os.fspath(path), content.encode(encoding))
+
+
+def write_bytes_file(path: str | Path, content: bytes) -> None:
+    """Write pre-encoded bytes to a file atomically.
+
+    Counterpart of :func:`write_text_file` for callers that already hold
+    encoded content and want to skip the str-to-bytes round-trip.
+
+    Args:
+        path: File path to write to.
+        content: Bytes to write.
+    """
+    _write_atomic(os.fspath(path), content)
+
+
+def write_text_files_batch(
+    paths_and_contents: list[tuple[str | Path, str | bytes]],
+    encoding: str = "utf-8",
+) -> None:
+    """Write several files atomically with one directory fsync per dir.
+
+    Each file goes through the same tmp-then-rename sequence as
+    :func:`write_text_file`, but the durability fsync on each containing
+    directory is issued once for the whole batch instead of per file.
+
+    Args:
+        paths_and_contents: Pairs of (file path, content) to write. Content
+            may be text or pre-encoded bytes.
+        encoding: Encoding for text content (default 'utf-8').
+    """
+    tmp_and_targets: list[tuple[str, str]] = []
+    parents: set[str] = set()
+
+    for path, content in paths_and_contents:
+        target = os.fspath(path)
+        parent = os.path.dirname(target)
+        if parent:
+            ensure_dir(parent)
+            parents.add(parent)
+
+        tmp_path = target + ".tmp"
+        encoded = content if isinstance(content, bytes) else content.encode(encoding)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, encoded)
+        finally:
+            os.close(fd)
+        tmp_and_targets.append((tmp_path, target))
+
+    for tmp_path, target in tmp_and_targets:
+        os.replace(tmp_path, target)
+
+    for parent in parents:
+        dirfd = os.open(parent, os.O_RDONLY)
+        try:
+            os.fsync(dirfd)
+        finally:
+            os.close(dirfd)
+
+
+@functools.lru_cache(maxsize=32)
+def _iso_date_cached(d: date) -> str:
+    """Format a date as YYYYMMDD via integer formatting (no strftime/locale)."""
+    return f"{d.year:04d}{d.month:02d}{d.day:02d}"
 
 
 def iso_date_string(d: Optional[date] = None) -> str:
     """Return an ISO date string in YYYYMMDD format.
 
+    Results are cached per date, so the repeated "today" lookups within a
+    run format the string once.
+
     Args:
         d: Date object to format. Defaults to today.
 
@@ -45,7 +135,7 @@ def iso_date_string(d: Optional[date] = None) -> str:
         A string representing the date in YYYYMMDD format.
     """
     d = d or date.today()
-    return d.strftime("%Y%m%d")
+    return _iso_date_cached(d)
 
 
 def branch_name_for_date(d: Optional[date] = None) -> str: